@@ -1,27 +1,84 @@
 import boto3
+import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
-import gzip
+import threading
 import time
 import pandas as pd
 from io import BytesIO
 from dotenv import load_dotenv
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from boto3.s3.transfer import TransferConfig
+from itertools import islice
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import pyarrow.parquet as pq
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 class DataFetcher:
-    def __init__(self, max_workers=4, final_s3_dir=''):
+    def __init__(self, max_workers=8, final_s3_dir=''):
+        # Shared TransferManager config for streamed uploads (small files, servers
+        # without Range support) and the SMILES Parquet. Large range-capable
+        # files bypass it via copy_ranged_to_s3, which uploads its own parts.
+        self.transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,  # 8 MB
+            max_concurrency=20,
+            multipart_chunksize=64 * 1024 * 1024  # 64 MB
+        )
+        self.download_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,  # 8 MB
+            max_concurrency=8,
+            multipart_chunksize=8 * 1024 * 1024  # 8 MB
+        )
+        self.prefetch_workers = 2
+        self.range_threshold = 8 * 1024 * 1024  # files above this are copied with ranged GETs
+        self.range_chunk_size = 16 * 1024 * 1024  # 16 MB per ranged GET / upload part
+        self.range_concurrency = 4  # ranged GETs in flight per file
+        self.range_retries = 3  # attempts per part when the connection drops mid-body
+
+        # Size the connection pool for every concurrent S3 request instead of
+        # botocore's default of 10. The single client is shared by all threads
+        # so connections are reused.
+        pool_size = max(
+            10,
+            self.transfer_config.max_concurrency + max_workers * self.range_concurrency,
+            self.prefetch_workers * self.download_config.max_concurrency
+        )
         self.s3_client = boto3.client(
             's3',
             aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
             aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-            region_name=os.getenv('AWS_REGION_NAME')
+            region_name=os.getenv('AWS_REGION_NAME'),
+            config=Config(
+                max_pool_connections=pool_size,
+                connect_timeout=3,
+                read_timeout=60,
+                retries={'mode': 'adaptive', 'max_attempts': 10},
+                tcp_keepalive=True
+            )
         )
+        self.transfer_manager = create_transfer_manager(self.s3_client, self.transfer_config)
         self.bucket = os.getenv('AWS_S3_BUCKET')
+
+        # Shared HTTP session so NCBI/PubChem calls reuse keep-alive connections.
+        # Ranged downloads open up to range_concurrency connections per file.
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(10, max_workers * self.range_concurrency),
+            max_retries=Retry(total=5, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        # Byte ranges must address the file as stored, not a re-encoded stream
+        self.identity_headers = {'Accept-Encoding': 'identity'}
         
         self.base_urls = {
             'phase1': 'https://ftp.ncbi.nlm.nih.gov/geo/series/GSE92nnn/GSE92742/suppl/',
@@ -44,65 +101,187 @@ class DataFetcher:
         self.max_workers = max_workers
         self.final_s3_dir = final_s3_dir.strip('/')
 
-        self.transfer_config = TransferConfig(
-            multipart_threshold=100 * 1024 * 1024,  # 100 MB
-            max_concurrency=4,
-            multipart_chunksize=50 * 1024 * 1024  # 50 MB
+        # Only the perturbagen name is needed from the (wide) sig_info files
+        self.sig_info_convert_options = pacsv.ConvertOptions(
+            include_columns=['pert_iname'],
+            column_types={'pert_iname': pa.string()},
+            strings_can_be_null=True
         )
-        
+
         # SMILES fetching parameters
-        self.pubchem_sleep = 0.2
+        self.pubchem_sleep = 0.2  # minimum interval between PubChem requests (5 req/s)
         self.pubchem_timeout = 10
+        self.pubchem_lock = threading.Lock()
+        self.pubchem_next_call = 0.0
 
-    def download_to_s3(self, filename, s3_prefix):
-        phase = 'phase1' if 'GSE92742' in filename else 'phase2'
-        url = self.base_urls[phase] + filename
+    def object_exists(self, s3_key):
+        """Check whether an object already exists in the bucket with a single HEAD request.
 
-        # Build final S3 key with optional final directory
+        Only a successful HEAD counts as existing. A 403 (S3's answer for a missing
+        key without s3:ListBucket, or for any key without s3:GetObject) is treated
+        as missing so write-only roles still upload.
+        """
+        try:
+            self.s3_client.head_object(Bucket=self.bucket, Key=s3_key)
+            return True
+        except ClientError as e:
+            code = e.response['Error']['Code']
+            if code in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            if code in ('403', 'AccessDenied', 'Forbidden'):
+                logger.warning("⚠ Cannot check s3://%s/%s (access denied), uploading anyway", self.bucket, s3_key)
+                return False
+            raise
+
+    def list_keys(self, prefix):
+        """List every key under a prefix, following list_objects_v2 continuation pages"""
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(Bucket=self.bucket, Prefix=prefix, PaginationConfig={'PageSize': 1000})
+        return {obj['Key'] for page in pages for obj in page.get('Contents', [])}
+
+    def build_s3_key(self, filename, s3_prefix):
+        """Build final S3 key with optional final directory"""
         if self.final_s3_dir:
-            s3_key = f"{self.final_s3_dir}/{s3_prefix}{filename}"
-        else:
-            s3_key = f"{s3_prefix}{filename}"
+            return f"{self.final_s3_dir}/{s3_prefix}{filename}"
+        return f"{s3_prefix}{filename}"
 
-        print(f"Downloading {filename} → s3://{self.bucket}/{s3_key}")
+    def download_to_s3(self, filename, s3_prefix, skip_existing=True):
+        phase = 'phase1' if 'GSE92742' in filename else 'phase2'
+        url = self.base_urls[phase] + filename
+        s3_key = self.build_s3_key(filename, s3_prefix)
 
         try:
-            with requests.get(url, stream=True, timeout=300) as response:
-                response.raise_for_status()
-                self.s3_client.upload_fileobj(
-                    response.raw,
-                    self.bucket,
-                    s3_key,
-                    Config=self.transfer_config
-                )
-            print(f"✓ Uploaded {filename}")
+            # Skip files uploaded by a previous run
+            if skip_existing and self.object_exists(s3_key):
+                logger.info("↷ Skipping %s (already at s3://%s/%s)", filename, self.bucket, s3_key)
+                return
+
+            logger.info("Downloading %s → s3://%s/%s", filename, self.bucket, s3_key)
+            head = self.session.head(url, headers=self.identity_headers, allow_redirects=True, timeout=30)
+            size = int(head.headers.get('Content-Length', 0))
+            if head.ok and head.headers.get('Accept-Ranges') == 'bytes' and size > self.range_threshold:
+                # Large file on a range-capable server: fetch parts in parallel
+                self.copy_ranged_to_s3(url, s3_key, size)
+            else:
+                with self.session.get(url, stream=True, timeout=300) as response:
+                    response.raise_for_status()
+                    self.transfer_manager.upload(response.raw, self.bucket, s3_key).result()
+            logger.info("✓ Uploaded %s", filename)
         except Exception as e:
-            print(f"✗ Failed {filename}: {e}")
+            logger.error("✗ Failed %s: %s", filename, e)
 
-    def fetch_all_parallel(self):
-        """Download all LINCS files"""
-        print("Starting parallel download of LINCS files...")
+    def copy_ranged_to_s3(self, url, s3_key, size):
+        """Copy a remote file to S3 as a multipart upload, fetching each part with its own HTTP Range request"""
+        chunk_size = self.range_chunk_size
+        n_parts = -(-size // chunk_size)
+        upload_id = self.s3_client.create_multipart_upload(Bucket=self.bucket, Key=s3_key)['UploadId']
+
+        def fetch_range(start, end):
+            headers = {**self.identity_headers, 'Range': f'bytes={start}-{end}'}
+            with self.session.get(url, headers=headers, stream=True, timeout=300) as response:
+                response.raise_for_status()
+                # Check the headers before reading, so a server that ignores
+                # Range and sends the whole file is never buffered in memory
+                expected_range = f'bytes {start}-{end}/{size}'
+                if response.status_code != 206 or response.headers.get('Content-Range') != expected_range:
+                    raise IOError(f"Bad range response for bytes {start}-{end} of {url}: "
+                                  f"{response.status_code} {response.headers.get('Content-Range')}")
+                body = response.content
+            if len(body) != end - start + 1:
+                raise IOError(f"Short range response for bytes {start}-{end} of {url}: got {len(body)} bytes")
+            return body
+
+        def copy_part(part_number):
+            start = (part_number - 1) * chunk_size
+            end = min(start + chunk_size, size) - 1
+            # The session's Retry covers connect errors and status codes, not a
+            # connection dropped mid-body, so retry those per part here
+            for attempt in range(1, self.range_retries + 1):
+                try:
+                    body = fetch_range(start, end)
+                    break
+                except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                    if attempt == self.range_retries:
+                        raise
+                    logger.warning("  ⚠ Retrying bytes %d-%d of %s (attempt %d): %s", start, end, url, attempt, e)
+            part = self.s3_client.upload_part(
+                Bucket=self.bucket,
+                Key=s3_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body
+            )
+            return {'ETag': part['ETag'], 'PartNumber': part_number}
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.range_concurrency) as executor:
+                parts = list(executor.map(copy_part, range(1, n_parts + 1)))
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+        except Exception:
+            try:
+                self.s3_client.abort_multipart_upload(Bucket=self.bucket, Key=s3_key, UploadId=upload_id)
+            except Exception as abort_error:
+                logger.error("✗ Failed to abort multipart upload %s for %s: %s", upload_id, s3_key, abort_error)
+            raise
+
+    def fetch_all_parallel(self, force=False):
+        """Download all LINCS files (files already in S3 are skipped unless force=True)"""
+        files = self.files
+        skip_existing = False
+        if not force:
+            # One paginated listing instead of a HEAD per file
+            keys = {filename: self.build_s3_key(filename, s3_prefix) for filename, s3_prefix in files.items()}
+            common_prefix = os.path.commonprefix(list(keys.values()))
+            try:
+                existing = self.list_keys(common_prefix[:common_prefix.rfind('/') + 1])
+            except ClientError as e:
+                # e.g. no s3:ListBucket permission: each file HEADs its own key and
+                # is skipped only if the HEAD succeeds (a 403 means upload anyway)
+                logger.warning("⚠ Could not list existing files (%s), checking each file instead", e)
+                skip_existing = True
+            else:
+                for filename, s3_key in keys.items():
+                    if s3_key in existing:
+                        logger.info("↷ Skipping %s (already at s3://%s/%s)", filename, self.bucket, s3_key)
+                files = {filename: s3_prefix for filename, s3_prefix in files.items() if keys[filename] not in existing}
+
+        logger.info("Starting parallel download of LINCS files...")
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            executor.map(lambda args: self.download_to_s3(*args), self.files.items())
+            executor.map(lambda args: self.download_to_s3(*args, skip_existing=skip_existing), files.items())
         
-        print("\n✓ All LINCS files downloaded")
+        logger.info("✓ All LINCS files downloaded")
+
+    def wait_for_pubchem(self):
+        """Space PubChem requests pubchem_sleep apart, counting time already spent on the previous request"""
+        with self.pubchem_lock:
+            now = time.monotonic()
+            wait = self.pubchem_next_call - now
+            self.pubchem_next_call = max(now, self.pubchem_next_call) + self.pubchem_sleep
+        if wait > 0:
+            time.sleep(wait)
 
     def get_smiles_pubchem(self, name, verbose=False):
         """Fetch SMILES string from PubChem for a compound name"""
         if not isinstance(name, str) or name.strip() == "":
             if verbose:
-                print(f"  ⚠ Invalid name: {name}")
+                logger.warning("  ⚠ Invalid name: %s", name)
             return None
         
         name_safe = requests.utils.requote_uri(name)
         url = f"https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/name/{name_safe}/property/CanonicalSMILES/JSON"
         
         try:
-            r = requests.get(url, timeout=self.pubchem_timeout)
+            self.wait_for_pubchem()
+            r = self.session.get(url, timeout=self.pubchem_timeout)
             if r.status_code != 200:
                 if verbose:
-                    print(f"  ⚠ PubChem API returned status {r.status_code} for '{name}'")
-                    print(f"     Response: {r.text[:200]}")
+                    logger.warning("  ⚠ PubChem API returned status %s for '%s'", r.status_code, name)
+                    logger.warning("     Response: %s", r.text[:200])
                 return None
             
             js = r.json()
@@ -110,14 +289,14 @@ class DataFetcher:
             # Check if response has expected structure
             if 'PropertyTable' not in js:
                 if verbose:
-                    print(f"  ⚠ Unexpected response structure for '{name}'")
-                    print(f"     Keys: {list(js.keys())}")
+                    logger.warning("  ⚠ Unexpected response structure for '%s'", name)
+                    logger.warning("     Keys: %s", list(js.keys()))
                 return None
             
             properties = js['PropertyTable'].get('Properties', [])
             if not properties:
                 if verbose:
-                    print(f"  ⚠ No properties found for '{name}'")
+                    logger.warning("  ⚠ No properties found for '%s'", name)
                 return None
             
             # PubChem returns 'SMILES' when requesting 'CanonicalSMILES'
@@ -127,33 +306,55 @@ class DataFetcher:
             
             if verbose:
                 if smiles:
-                    print(f"  ✓ Found SMILES for '{name}': {smiles[:50]}...")
+                    logger.info("  ✓ Found SMILES for '%s': %s...", name, smiles[:50])
                 else:
-                    print(f"  ⚠ No SMILES field found for '{name}'")
-                    print(f"     Available fields: {list(prop.keys())}")
+                    logger.warning("  ⚠ No SMILES field found for '%s'", name)
+                    logger.warning("     Available fields: %s", list(prop.keys()))
             return smiles
             
         except KeyError as e:
             if verbose:
-                print(f"  ⚠ KeyError parsing PubChem response for '{name}': {e}")
+                logger.warning("  ⚠ KeyError parsing PubChem response for '%s': %s", name, e)
                 if 'js' in locals():
-                    print(f"     Response keys: {list(js.keys())}")
+                    logger.warning("     Response keys: %s", list(js.keys()))
             return None
         except Exception as e:
             if verbose:
-                print(f"  ⚠ Exception fetching SMILES for '{name}': {type(e).__name__}: {e}")
+                logger.warning("  ⚠ Exception fetching SMILES for '%s': %s: %s", name, type(e).__name__, e)
             return None
 
     def write_parquet_to_s3(self, df, s3_key):
         """Write DataFrame as Parquet to S3"""
         table = pa.Table.from_pandas(df)
-        out = pa.BufferOutputStream()
-        pq.write_table(table, out)
-        self.s3_client.put_object(
-            Bucket=self.bucket, 
-            Key=s3_key, 
-            Body=out.getvalue().to_pybytes()
+        out = BytesIO()
+        pq.write_table(
+            table,
+            out,
+            compression='zstd',
+            compression_level=3,
+            use_dictionary=True,
+            data_page_size=1 << 20
         )
+        size = out.tell()
+        out.seek(0)
+        extra_args = {'ContentType': 'application/vnd.apache.parquet'}
+        if size < self.transfer_config.multipart_threshold:
+            # Small file: one PutObject, no multipart state machine
+            self.s3_client.put_object(Bucket=self.bucket, Key=s3_key, Body=out, **extra_args)
+        else:
+            self.transfer_manager.upload(out, self.bucket, s3_key, extra_args=extra_args).result()
+
+    def download_from_s3(self, s3_key):
+        """Download an S3 object into memory (ranged parallel GETs above the threshold)"""
+        buffer = BytesIO()
+        self.s3_client.download_fileobj(
+            self.bucket,
+            s3_key,
+            buffer,
+            Config=self.download_config
+        )
+        buffer.seek(0)
+        return buffer
 
     def build_smiles_map(self, sig_info_s3_keys, cache_s3_key=None, output_s3_key=None):
         """
@@ -164,61 +365,78 @@ class DataFetcher:
             cache_s3_key: Optional S3 key to existing SMILES map for caching.
             output_s3_key: Optional S3 key to save output (.parquet).
         """
-        print("Building SMILES map from perturbagen info...")
+        logger.info("Building SMILES map from perturbagen info...")
 
         all_names = set()
 
-        # Collect all unique perturbagen names from S3 files
-        for s3_key in sig_info_s3_keys:
-            print(f"\nReading s3://{self.bucket}/{s3_key}...")
-            try:
-                # Download file from S3
-                response = self.s3_client.get_object(Bucket=self.bucket, Key=s3_key)
-                
-                # Read based on file type
-                if s3_key.endswith('.gz'):
-                    with gzip.open(BytesIO(response['Body'].read()), "rt") as f:
-                        sig_df = pd.read_csv(f, sep="\t", low_memory=False)
-                else:
-                    sig_df = pd.read_csv(BytesIO(response['Body'].read()), sep="\t", low_memory=False)
-                
-                unique_names = sig_df['pert_iname'].dropna().unique()
-                all_names.update(unique_names)
-                print(f"  Found {len(unique_names)} unique compounds")
-                # Show sample names for debugging
-                print(f"  Sample compound names (first 3):")
-                for sample_name in list(unique_names)[:3]:
-                    print(f"    - {sample_name}")
-            except Exception as e:
-                print(f"  ✗ Failed to read {s3_key}: {e}")
+        # Collect all unique perturbagen names from S3 files. Downloads run
+        # ahead in the background so the next file arrives while one parses;
+        # at most prefetch_workers buffers are held at any time.
+        with ThreadPoolExecutor(max_workers=self.prefetch_workers) as prefetch:
+            remaining = iter(sig_info_s3_keys)
+            pending = deque(
+                (s3_key, prefetch.submit(self.download_from_s3, s3_key))
+                for s3_key in islice(remaining, self.prefetch_workers)
+            )
+            while pending:
+                s3_key, download = pending.popleft()
+                logger.info("Reading s3://%s/%s...", self.bucket, s3_key)
+                try:
+                    source = download.result()
 
-        print(f"\nTotal unique compounds across all files: {len(all_names)}")
+                    # Read based on file type
+                    if s3_key.endswith('.gz'):
+                        source = pa.CompressedInputStream(source, 'gzip')
+                    sig_table = pacsv.read_csv(
+                        source,
+                        read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+                        parse_options=pacsv.ParseOptions(delimiter="\t"),
+                        convert_options=self.sig_info_convert_options
+                    )
+
+                    unique_names = pc.unique(sig_table['pert_iname'].drop_null()).to_pylist()
+                    all_names.update(unique_names)
+                    logger.info("  Found %d unique compounds", len(unique_names))
+                    # Show sample names for debugging
+                    logger.info("  Sample compound names (first 3): %s", unique_names[:3])
+                except Exception as e:
+                    logger.error("  ✗ Failed to read %s: %s", s3_key, e)
+
+                # Release this file's buffer before fetching the next one
+                source = sig_table = download = None
+                next_key = next(remaining, None)
+                if next_key is not None:
+                    pending.append((next_key, prefetch.submit(self.download_from_s3, next_key)))
+
+        logger.info("Total unique compounds across all files: %d", len(all_names))
 
         # Load cache if available
         cache = {}
         if cache_s3_key:
             try:
-                print(f"Loading cache from s3://{self.bucket}/{cache_s3_key}...")
-                response = self.s3_client.get_object(Bucket=self.bucket, Key=cache_s3_key)
-                cache_df = pd.read_parquet(BytesIO(response['Body'].read()))
-                cache = dict(zip(cache_df['pert_iname'], cache_df['smiles']))
-                print(f"✓ Loaded {len(cache)} cached SMILES entries")
+                logger.info("Loading cache from s3://%s/%s...", self.bucket, cache_s3_key)
+                cache_table = pq.read_table(
+                    self.download_from_s3(cache_s3_key),
+                    columns=['pert_iname', 'smiles']
+                )
+                cache = dict(zip(cache_table['pert_iname'].to_pylist(), cache_table['smiles'].to_pylist()))
+                logger.info("✓ Loaded %d cached SMILES entries", len(cache))
             except Exception as e:
-                print(f"No cache found or failed to load: {e}")
-                print("Starting fresh without cache")
+                logger.info("No cache found or failed to load: %s", e)
+                logger.info("Starting fresh without cache")
 
         # Fetch SMILES for each compound
         records = []
         cached_count = 0
         fetched_count = 0
 
-        print("\nFetching SMILES from PubChem...")
+        logger.info("Fetching SMILES from PubChem...")
         # Test first few names with verbose output to diagnose issues
         if all_names:
             first_name = list(sorted(all_names))[0]
-            print(f"  Testing first compound: '{first_name}'")
+            logger.info("  Testing first compound: '%s'", first_name)
             test_result = self.get_smiles_pubchem(first_name, verbose=True)
-            print(f"  Result: {test_result}\n")
+            logger.info("  Result: %s", test_result)
         
         for i, name in enumerate(sorted(all_names), 1):
             if name in cache:
@@ -227,13 +445,12 @@ class DataFetcher:
             else:
                 smiles = self.get_smiles_pubchem(name, verbose=(i <= 3))  # Verbose for first 3
                 fetched_count += 1
-                time.sleep(self.pubchem_sleep)
 
             records.append({"pert_iname": name, "smiles": smiles})
 
             if i % 100 == 0:
-                print(f"  Progress: {i}/{len(all_names)} compounds processed "
-                    f"(cached: {cached_count}, fetched: {fetched_count})")
+                logger.info("  Progress: %d/%d compounds processed (cached: %d, fetched: %d)",
+                            i, len(all_names), cached_count, fetched_count)
 
         # Create DataFrame
         df = pd.DataFrame.from_records(records)
@@ -244,21 +461,25 @@ class DataFetcher:
             output_s3_key = f"{self.final_s3_dir}/processed/smiles_map.parquet" if self.final_s3_dir else "processed/smiles_map.parquet"
 
         # Save to S3 as Parquet
-        print(f"\nWriting SMILES map to s3://{self.bucket}/{output_s3_key}")
-        print(f"  Total compounds: {len(df)}")
-        print(f"  SMILES found: {non_null} ({100*non_null/len(df):.1f}%)")
-        print(f"  SMILES missing: {len(df) - non_null}")
+        logger.info("Writing SMILES map to s3://%s/%s", self.bucket, output_s3_key)
+        logger.info("  Total compounds: %d", len(df))
+        logger.info("  SMILES found: %d (%.1f%%)", non_null, 100 * non_null / len(df))
+        logger.info("  SMILES missing: %d", len(df) - non_null)
 
         self.write_parquet_to_s3(df, output_s3_key)
-        print("✓ SMILES map complete\n")
+        logger.info("✓ SMILES map complete")
 
         return df
 
 
 
 if __name__ == "__main__":
+    # Keep boto3/urllib3 quiet; only this script's progress messages at INFO
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+
     # Option 1: Keep SmilesFetcher and use it for everything
-    fetcher = DataFetcher(max_workers=4, final_s3_dir='Lincs_data')
+    fetcher = DataFetcher(final_s3_dir='Lincs_data')
 
     # Download LINCS files
     fetcher.fetch_all_parallel()